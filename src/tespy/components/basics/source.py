@@ -115,11 +115,12 @@ class Source(Component):
 
             \dot{E}_\mathrm{bus} = \dot{E}_\mathrm{out}^\mathrm{PH}
         """
+        outconn = self.outl[0]
         self.E_P = np.nan
         self.E_F = np.nan
         self.E_bus = {
-            "chemical": self.outl[0].Ex_chemical,
-            "physical": self.outl[0].Ex_physical,
+            "chemical": outconn.Ex_chemical,
+            "physical": outconn.Ex_physical,
             "massless": 0
         }
         self.E_D = np.nan
@@ -21,6 +21,8 @@ from tespy.tools.data_containers import ComponentCharacteristics as dc_cc
 from tespy.tools.data_containers import ComponentProperties as dc_cp
 from tespy.tools.data_containers import GroupedComponentCharacteristics as dc_gcc
 from tespy.tools.document_models import generate_latex_eq
+from tespy.tools.fluid_properties import dT_mix_dph
+from tespy.tools.fluid_properties import dT_mix_pdh
 from tespy.tools.fluid_properties import h_mix_pT
 from tespy.tools.fluid_properties import s_mix_ph
 
@@ -299,11 +301,11 @@ class HeatExchanger(Component):
                 0 = \dot{m}_{in,1} \cdot \left(h_{out,1} - h_{in,1} \right) +
                 \dot{m}_{in,2} \cdot \left(h_{out,2} - h_{in,2} \right)
         """
+        i1, i2 = self.inl
+        o1, o2 = self.outl
         return (
-            self.inl[0].m.val_SI
-            * (self.outl[0].h.val_SI - self.inl[0].h.val_SI)
-            + self.inl[1].m.val_SI
-            * (self.outl[1].h.val_SI - self.inl[1].h.val_SI)
+            i1.m.val_SI * (o1.h.val_SI - i1.h.val_SI)
+            + i2.m.val_SI * (o2.h.val_SI - i2.h.val_SI)
         )
 
     def energy_balance_func_doc(self, label):
@@ -360,9 +362,9 @@ class HeatExchanger(Component):
 
                 0 =\dot{m}_{in,1} \cdot \left(h_{out,1}-h_{in,1}\right)-\dot{Q}
         """
-        return self.inl[0].m.val_SI * (
-            self.outl[0].h.val_SI - self.inl[0].h.val_SI
-        ) - self.Q.val
+        i = self.inl[0]
+        o = self.outl[0]
+        return i.m.val_SI * (o.h.val_SI - i.h.val_SI) - self.Q.val
 
     def energy_balance_hot_func_doc(self, label):
         r"""
@@ -410,23 +412,14 @@ class HeatExchanger(Component):
         o1 = self.outl[0]
         o2 = self.outl[1]
 
-        # temperature value manipulation for convergence stability
         T_i1 = i1.calc_T()
         T_i2 = i2.calc_T()
         T_o1 = o1.calc_T()
         T_o2 = o2.calc_T()
 
-        if T_i1 <= T_o2:
-            T_i1 = T_o2 + 0.01
-        if T_i1 <= T_o2:
-            T_o2 = T_i1 - 0.01
-        if T_i1 <= T_o2:
-            T_o1 = T_i2 + 0.02
-        if T_o1 <= T_i2:
-            T_i2 = T_o1 - 0.02
-
-        ttd_u = T_i1 - T_o2
-        ttd_l = T_o1 - T_i2
+        # temperature difference manipulation for convergence stability
+        ttd_u = 0.01 if T_i1 <= T_o2 else T_i1 - T_o2
+        ttd_l = 0.02 if T_o1 <= T_i2 else T_o1 - T_i2
 
         if ttd_u == ttd_l:
             td_log = ttd_l
@@ -435,6 +428,103 @@ class HeatExchanger(Component):
 
         return td_log
 
+    def calculate_td_log_deriv(self):
+        r"""
+        Calculate partial derivatives of the logarithmic temperature difference.
+
+        Returns
+        -------
+        deriv : dict
+            Partial derivatives of :math:`\Delta T_\mathrm{log}` with respect
+            to the pressure and enthalpy variables of the connections, indexed
+            by the variables' column in the Jacobian matrix.
+
+        Note
+        ----
+        With :math:`\Delta T_\mathrm{u}=T_\mathrm{in,1}-T_\mathrm{out,2}`
+        and :math:`\Delta T_\mathrm{l}=T_\mathrm{out,1}-T_\mathrm{in,2}` the
+        derivatives are obtained by the chain rule:
+
+        .. math::
+
+            \frac{\partial \Delta T_\mathrm{log}}{\partial \Delta T_\mathrm{u}}
+            = \frac{\frac{\Delta T_\mathrm{l} - \Delta T_\mathrm{u}}
+            {\Delta T_\mathrm{u}} - \ln{\frac{\Delta T_\mathrm{l}}
+            {\Delta T_\mathrm{u}}}}
+            {\ln^2{\frac{\Delta T_\mathrm{l}}{\Delta T_\mathrm{u}}}}\\
+            \frac{\partial \Delta T_\mathrm{log}}{\partial \Delta T_\mathrm{l}}
+            = \frac{\ln{\frac{\Delta T_\mathrm{l}}{\Delta T_\mathrm{u}}}
+            - \frac{\Delta T_\mathrm{l} - \Delta T_\mathrm{u}}
+            {\Delta T_\mathrm{l}}}
+            {\ln^2{\frac{\Delta T_\mathrm{l}}{\Delta T_\mathrm{u}}}}
+
+        Terminal temperature differences fixed by the manipulation in
+        :py:meth:`calculate_td_log` do not contribute to the derivatives, the
+        respective entries are zero.
+        """
+        i1 = self.inl[0]
+        i2 = self.inl[1]
+        o1 = self.outl[0]
+        o2 = self.outl[1]
+
+        T_i1 = i1.calc_T()
+        T_i2 = i2.calc_T()
+        T_o1 = o1.calc_T()
+        T_o2 = o2.calc_T()
+
+        # same value manipulation as in calculate_td_log
+        if T_i1 <= T_o2:
+            ttd_u = 0.01
+            ttd_u_var = False
+        else:
+            ttd_u = T_i1 - T_o2
+            ttd_u_var = True
+
+        if T_o1 <= T_i2:
+            ttd_l = 0.02
+            ttd_l_var = False
+        else:
+            ttd_l = T_o1 - T_i2
+            ttd_l_var = True
+
+        if ttd_u == ttd_l:
+            dtd_log_dttd_u = 0.5
+            dtd_log_dttd_l = 0.5
+        else:
+            log = math.log(ttd_l / ttd_u)
+            dtd_log_dttd_u = ((ttd_l - ttd_u) / ttd_u - log) / log ** 2
+            dtd_log_dttd_l = (log - (ttd_l - ttd_u) / ttd_l) / log ** 2
+
+        factors = []
+        if ttd_u_var:
+            factors += [(i1, dtd_log_dttd_u), (o2, -dtd_log_dttd_u)]
+        if ttd_l_var:
+            factors += [(o1, dtd_log_dttd_l), (i2, -dtd_log_dttd_l)]
+
+        # the Jacobian is not reset between iterations, all pressure and
+        # enthalpy entries are written to overwrite previous values in case
+        # a terminal temperature difference is fixed by the manipulation
+        deriv = {}
+        for c in self.inl + self.outl:
+            if self.is_variable(c.p):
+                deriv[c.p.J_col] = 0.0
+            if self.is_variable(c.h):
+                deriv[c.h.J_col] = 0.0
+
+        for c, factor in factors:
+            args = (c.p.val_SI, c.h.val_SI, c.fluid_data, c.mixing_rule)
+            # variables may be shared by connections, therefore accumulate
+            if self.is_variable(c.p):
+                deriv[c.p.J_col] += factor * dT_mix_dph(
+                    *args, T0=c.T.val_SI
+                )
+            if self.is_variable(c.h):
+                deriv[c.h.J_col] += factor * dT_mix_pdh(
+                    *args, T0=c.T.val_SI
+                )
+
+        return deriv
+
     def kA_func(self):
         r"""
         Calculate heat transfer from heat transfer coefficient.
@@ -452,10 +542,11 @@ class HeatExchanger(Component):
                 {\ln{\frac{T_{out,1} - T_{in,2}}{T_{in,1} - T_{out,2}}}}
         """
 
+        i = self.inl[0]
+        o = self.outl[0]
         return (
-            self.inl[0].m.val_SI * (
-                self.outl[0].h.val_SI - self.inl[0].h.val_SI
-            ) + self.kA.val * self.calculate_td_log()
+            i.m.val_SI * (o.h.val_SI - i.h.val_SI)
+            + self.kA.val * self.calculate_td_log()
         )
 
     def kA_func_doc(self, label):
@@ -493,16 +584,46 @@ class HeatExchanger(Component):
         k : int
             Position of derivatives in Jacobian matrix (k-th equation).
         """
-        f = self.kA_func
         i = self.inl[0]
         o = self.outl[0]
         if self.is_variable(i.m):
             self.jacobian[k, i.m.J_col] = o.h.val_SI - i.h.val_SI
-        for c in self.inl + self.outl:
-            if self.is_variable(c.p):
-                self.jacobian[k, c.p.J_col] = self.numeric_deriv(f, 'p', c)
-            if self.is_variable(c.h):
-                self.jacobian[k, c.h.J_col] = self.numeric_deriv(f, 'h', c)
+
+        deriv = {
+            col: self.kA.val * d
+            for col, d in self.calculate_td_log_deriv().items()
+        }
+        if self.is_variable(i.h):
+            deriv[i.h.J_col] = deriv.get(i.h.J_col, 0) - i.m.val_SI
+        if self.is_variable(o.h):
+            deriv[o.h.J_col] = deriv.get(o.h.J_col, 0) + i.m.val_SI
+
+        for col, d in deriv.items():
+            self.jacobian[k, col] = d
+
+    def calc_kA_char_factor(self):
+        r"""
+        Calculate the factor for heat transfer coefficient characteristic.
+
+        Returns
+        -------
+        fkA : float
+            Factor applied to the design value of the heat transfer
+            coefficient.
+
+            .. math::
+
+                f_{kA} = \frac{2}{\frac{1}{f_1\left( expr_1\right)} +
+                \frac{1}{f_2\left( expr_2\right)}}
+        """
+        p1 = self.kA_char1.param
+        p2 = self.kA_char2.param
+        f1 = self.get_char_expr(p1, **self.kA_char1.char_params)
+        f2 = self.get_char_expr(p2, **self.kA_char2.char_params)
+
+        fkA1 = self.kA_char1.char_func.evaluate(f1)
+        fkA2 = self.kA_char2.char_func.evaluate(f2)
+        return 2 / (1 / fkA1 + 1 / fkA2)
 
     def kA_char_func(self):
         r"""
@@ -528,21 +649,14 @@ class HeatExchanger(Component):
         For standard functions f\ :subscript:`1` \ and f\ :subscript:`2` \ see
         module :py:mod:`tespy.data`.
         """
-        p1 = self.kA_char1.param
-        p2 = self.kA_char2.param
-        f1 = self.get_char_expr(p1, **self.kA_char1.char_params)
-        f2 = self.get_char_expr(p2, **self.kA_char2.char_params)
-
-        fkA1 = self.kA_char1.char_func.evaluate(f1)
-        fkA2 = self.kA_char2.char_func.evaluate(f2)
-        fkA = 2 / (1 / fkA1 + 1 / fkA2)
-
+        fkA = self.calc_kA_char_factor()
         td_log = self.calculate_td_log()
 
+        i = self.inl[0]
+        o = self.outl[0]
         return (
-            self.inl[0].m.val_SI * (
-                self.outl[0].h.val_SI - self.inl[0].h.val_SI
-            ) + self.kA.design * fkA * td_log
+            i.m.val_SI * (o.h.val_SI - i.h.val_SI)
+            + self.kA.design * fkA * td_log
         )
 
     def kA_char_func_doc(self, label):
@@ -590,11 +704,32 @@ class HeatExchanger(Component):
         for i in self.inl:
             if self.is_variable(i.m):
                 self.jacobian[k, i.m.J_col] = self.numeric_deriv(f, 'm', i)
-        for c in self.inl + self.outl:
-            if self.is_variable(c.p):
-                self.jacobian[k, c.p.J_col] = self.numeric_deriv(f, 'p', c)
-            if self.is_variable(c.h):
-                self.jacobian[k, c.h.J_col] = self.numeric_deriv(f, 'h', c)
+
+        if not (
+                self.kA_char1.param in ['m', 'm_out']
+                and self.kA_char2.param in ['m', 'm_out']):
+            # characteristic expressions depend on pressure or enthalpy
+            for c in self.inl + self.outl:
+                if self.is_variable(c.p):
+                    self.jacobian[k, c.p.J_col] = self.numeric_deriv(f, 'p', c)
+                if self.is_variable(c.h):
+                    self.jacobian[k, c.h.J_col] = self.numeric_deriv(f, 'h', c)
+            return
+
+        fkA = self.calc_kA_char_factor()
+        i = self.inl[0]
+        o = self.outl[0]
+        deriv = {
+            col: self.kA.design * fkA * d
+            for col, d in self.calculate_td_log_deriv().items()
+        }
+        if self.is_variable(i.h):
+            deriv[i.h.J_col] = deriv.get(i.h.J_col, 0) - i.m.val_SI
+        if self.is_variable(o.h):
+            deriv[o.h.J_col] = deriv.get(o.h.J_col, 0) + i.m.val_SI
+
+        for col, d in deriv.items():
+            self.jacobian[k, col] = d
 
     def ttd_u_func(self):
         r"""
@@ -644,12 +779,16 @@ class HeatExchanger(Component):
         k : int
             Position of derivatives in Jacobian matrix (k-th equation).
         """
-        f = self.ttd_u_func
-        for c in [self.inl[0], self.outl[1]]:
+        for c, sign in [(self.inl[0], -1), (self.outl[1], 1)]:
+            args = (c.p.val_SI, c.h.val_SI, c.fluid_data, c.mixing_rule)
             if self.is_variable(c.p, increment_filter):
-                self.jacobian[k, c.p.J_col] = self.numeric_deriv(f, 'p', c)
+                self.jacobian[k, c.p.J_col] = sign * dT_mix_dph(
+                    *args, T0=c.T.val_SI
+                )
             if self.is_variable(c.h, increment_filter):
-                self.jacobian[k, c.h.J_col] = self.numeric_deriv(f, 'h', c)
+                self.jacobian[k, c.h.J_col] = sign * dT_mix_pdh(
+                    *args, T0=c.T.val_SI
+                )
 
     def ttd_l_func(self):
         r"""
@@ -699,12 +838,16 @@ class HeatExchanger(Component):
         k : int
             Position of derivatives in Jacobian matrix (k-th equation).
         """
-        f = self.ttd_l_func
-        for c in [self.inl[1], self.outl[0]]:
+        for c, sign in [(self.inl[1], 1), (self.outl[0], -1)]:
+            args = (c.p.val_SI, c.h.val_SI, c.fluid_data, c.mixing_rule)
             if self.is_variable(c.p, increment_filter):
-                self.jacobian[k, c.p.J_col] = self.numeric_deriv(f, 'p', c)
+                self.jacobian[k, c.p.J_col] = sign * dT_mix_dph(
+                    *args, T0=c.T.val_SI
+                )
             if self.is_variable(c.h, increment_filter):
-                self.jacobian[k, c.h.J_col] = self.numeric_deriv(f, 'h', c)
+                self.jacobian[k, c.h.J_col] = sign * dT_mix_pdh(
+                    *args, T0=c.T.val_SI
+                )
 
     def calc_dh_max_cold(self):
         r"""Calculate the theoretical maximum enthalpy increase on the cold side
@@ -1038,12 +1181,12 @@ class HeatExchanger(Component):
         self.ttd_l.val = self.outl[0].T.val_SI - self.inl[1].T.val_SI
 
         # pr and zeta
-        for i in range(2):
-            self.get_attr('pr' + str(i + 1)).val = (
-                self.outl[i].p.val_SI / self.inl[i].p.val_SI)
-            self.get_attr('zeta' + str(i + 1)).val = self.calc_zeta(
-                self.inl[i], self.outl[i]
-            )
+        i1, i2 = self.inl
+        o1, o2 = self.outl
+        self.pr1.val = o1.p.val_SI / i1.p.val_SI
+        self.pr2.val = o2.p.val_SI / i2.p.val_SI
+        self.zeta1.val = self.calc_zeta(i1, o1)
+        self.zeta2.val = self.calc_zeta(i2, o2)
 
         # kA and logarithmic temperature difference
         if self.ttd_u.val < 0 or self.ttd_l.val < 0:
@@ -1132,38 +1275,31 @@ class HeatExchanger(Component):
             \text{T\_mQ1}=\frac{\dot{Q}}{\text{S\_Q1}}\\
             \text{T\_mQ2}=\frac{\dot{Q}}{\text{S\_Q2}}
         """
-        self.S_irr = 0
-        for i in range(2):
-            inl = self.inl[i]
-            out = self.outl[i]
-            p_star = inl.p.val_SI * (
-                self.get_attr('pr' + str(i + 1)).val) ** 0.5
+        S_Q = []
+        S_irr = []
+        T_mQ = []
+        for inl, out, pr in zip(
+                self.inl, self.outl, [self.pr1.val, self.pr2.val]):
+            m = inl.m.val_SI
+            h_in = inl.h.val_SI
+            h_out = out.h.val_SI
+            p_star = inl.p.val_SI * math.sqrt(pr)
             s_i_star = s_mix_ph(
-                p_star, inl.h.val_SI, inl.fluid_data, inl.mixing_rule,
-                T0=inl.T.val_SI
+                p_star, h_in, inl.fluid_data, inl.mixing_rule, T0=inl.T.val_SI
             )
             s_o_star = s_mix_ph(
-                p_star, out.h.val_SI, out.fluid_data, out.mixing_rule,
+                p_star, h_out, out.fluid_data, out.mixing_rule,
                 T0=out.T.val_SI
             )
+            S_Q_side = m * (s_o_star - s_i_star)
+            S_Q += [S_Q_side]
+            S_irr += [m * (out.s.val_SI - inl.s.val_SI) - S_Q_side]
+            T_mQ += [m * (h_out - h_in) / S_Q_side]
 
-            setattr(
-                self, 'S_Q' + str(i + 1),
-                inl.m.val_SI * (s_o_star - s_i_star)
-            )
-            S_Q = self.get_attr('S_Q' + str(i + 1))
-            setattr(
-                self, 'S_irr' + str(i + 1),
-                inl.m.val_SI * (out.s.val_SI - inl.s.val_SI) - S_Q
-            )
-            setattr(
-                self, 'T_mQ' + str(i + 1),
-                inl.m.val_SI * (out.h.val_SI - inl.h.val_SI) / S_Q
-            )
-
-            self.S_irr += self.get_attr('S_irr' + str(i + 1))
-
-        self.S_irr += self.S_Q1 + self.S_Q2
+        self.S_Q1, self.S_Q2 = S_Q
+        self.S_irr1, self.S_irr2 = S_irr
+        self.T_mQ1, self.T_mQ2 = T_mQ
+        self.S_irr = (self.S_irr1 + self.S_irr2) + (self.S_Q1 + self.S_Q2)
 
     def exergy_balance(self, T0):
         r"""
@@ -1243,33 +1379,37 @@ class HeatExchanger(Component):
             T_\mathrm{out,2} \geq T_0 > T_\mathrm{in,2}\\
             \end{cases}
         """
-        if all([c.T.val_SI > T0 for c in self.inl + self.outl]):
-            self.E_P = self.outl[1].Ex_therm - self.inl[1].Ex_therm
-            self.E_F = self.inl[0].Ex_physical - self.outl[0].Ex_physical + (
-                self.inl[1].Ex_mech - self.outl[1].Ex_mech)
-        elif all([c.T.val_SI <= T0 for c in self.inl + self.outl]):
-            self.E_P = self.outl[0].Ex_therm - self.inl[0].Ex_therm
-            self.E_F = self.inl[1].Ex_physical - self.outl[1].Ex_physical + (
-                self.inl[0].Ex_mech - self.outl[0].Ex_mech)
-        elif (self.inl[0].T.val_SI > T0 and self.outl[1].T.val_SI > T0 and
-              self.outl[0].T.val_SI <= T0 and self.inl[1].T.val_SI <= T0):
-            self.E_P = self.outl[0].Ex_therm + self.outl[1].Ex_therm
-            self.E_F = self.inl[0].Ex_physical + self.inl[1].Ex_physical - (
-                self.outl[0].Ex_mech + self.outl[1].Ex_mech)
-        elif (self.inl[0].T.val_SI > T0 and self.inl[1].T.val_SI <= T0 and
-              self.outl[0].T.val_SI <= T0 and self.outl[1].T.val_SI <= T0):
-            self.E_P = self.outl[0].Ex_therm
-            self.E_F = self.inl[0].Ex_physical + self.inl[1].Ex_physical - (
-                self.outl[1].Ex_physical + self.outl[0].Ex_mech)
-        elif (self.inl[0].T.val_SI > T0 and self.outl[0].T.val_SI > T0 and
-              self.inl[1].T.val_SI <= T0 and self.outl[1].T.val_SI <= T0):
+        i1, i2 = self.inl
+        o1, o2 = self.outl
+        T_i1 = i1.T.val_SI
+        T_i2 = i2.T.val_SI
+        T_o1 = o1.T.val_SI
+        T_o2 = o2.T.val_SI
+
+        if T_i1 > T0 and T_i2 > T0 and T_o1 > T0 and T_o2 > T0:
+            self.E_P = o2.Ex_therm - i2.Ex_therm
+            self.E_F = i1.Ex_physical - o1.Ex_physical + (
+                i2.Ex_mech - o2.Ex_mech)
+        elif T_i1 <= T0 and T_i2 <= T0 and T_o1 <= T0 and T_o2 <= T0:
+            self.E_P = o1.Ex_therm - i1.Ex_therm
+            self.E_F = i2.Ex_physical - o2.Ex_physical + (
+                i1.Ex_mech - o1.Ex_mech)
+        elif T_i1 > T0 and T_o2 > T0 and T_o1 <= T0 and T_i2 <= T0:
+            self.E_P = o1.Ex_therm + o2.Ex_therm
+            self.E_F = i1.Ex_physical + i2.Ex_physical - (
+                o1.Ex_mech + o2.Ex_mech)
+        elif T_i1 > T0 and T_i2 <= T0 and T_o1 <= T0 and T_o2 <= T0:
+            self.E_P = o1.Ex_therm
+            self.E_F = i1.Ex_physical + i2.Ex_physical - (
+                o2.Ex_physical + o1.Ex_mech)
+        elif T_i1 > T0 and T_o1 > T0 and T_i2 <= T0 and T_o2 <= T0:
             self.E_P = np.nan
-            self.E_F = self.inl[0].Ex_physical - self.outl[0].Ex_physical + (
-                self.inl[1].Ex_physical - self.outl[1].Ex_physical)
+            self.E_F = i1.Ex_physical - o1.Ex_physical + (
+                i2.Ex_physical - o2.Ex_physical)
         else:
-            self.E_P = self.outl[1].Ex_therm
-            self.E_F = self.inl[0].Ex_physical - self.outl[0].Ex_physical + (
-                self.inl[1].Ex_physical - self.outl[1].Ex_mech)
+            self.E_P = o2.Ex_therm
+            self.E_F = i1.Ex_physical - o1.Ex_physical + (
+                i2.Ex_physical - o2.Ex_mech)
 
         self.E_bus = {"chemical": np.nan, "physical": np.nan, "massless": np.nan}
         if np.isnan(self.E_P):
@@ -1290,12 +1430,13 @@ class HeatExchanger(Component):
             connection index ('in1' -> 'out1', therefore :code:`1` etc.).
         """
         return {
-            i + 1: {
+            num + 1: {
                 'isoline_property': 'p',
-                'isoline_value': self.inl[i].p.val,
-                'isoline_value_end': self.outl[i].p.val,
+                'isoline_value': i.p.val,
+                'isoline_value_end': o.p.val,
                 'starting_point_property': 'v',
-                'starting_point_value': self.inl[i].vol.val,
+                'starting_point_value': i.vol.val,
                 'ending_point_property': 'v',
-                'ending_point_value': self.outl[i].vol.val
-            } for i in range(2)}
+                'ending_point_value': o.vol.val
+            } for num, (i, o) in enumerate(zip(self.inl, self.outl))
+        }
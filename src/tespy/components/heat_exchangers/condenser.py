@@ -23,6 +23,9 @@ from tespy.tools.data_containers import GroupedComponentCharacteristics as dc_gc
 from tespy.tools.data_containers import SimpleDataContainer as dc_simple
 from tespy.tools.document_models import generate_latex_eq
 from tespy.tools.fluid_properties import dh_mix_dpQ
+from tespy.tools.fluid_properties import dT_mix_dph
+from tespy.tools.fluid_properties import dT_mix_pdh
+from tespy.tools.fluid_properties import dT_sat_dp
 from tespy.tools.fluid_properties import h_mix_pQ
 
 
@@ -353,6 +356,33 @@ class Condenser(HeatExchanger):
 
         return td_log
 
+    def calculate_td_log_deriv(self):
+        r"""
+        Calculate partial derivatives of the logarithmic temperature difference.
+
+        Returns
+        -------
+        deriv : dict
+            Partial derivatives of :math:`\Delta T_\mathrm{log}` with respect
+            to the pressure and enthalpy variables of the connections, indexed
+            by the variables' column in the Jacobian matrix.
+
+        Note
+        ----
+        The derivatives are calculated numerically, as the upper terminal
+        temperature difference refers to the saturation temperature of the
+        hot side inlet.
+        """
+        f = self.calculate_td_log
+        deriv = {}
+        for c in self.inl + self.outl:
+            if self.is_variable(c.p):
+                deriv[c.p.J_col] = self.numeric_deriv(f, 'p', c)
+            if self.is_variable(c.h):
+                deriv[c.h.J_col] = self.numeric_deriv(f, 'h', c)
+
+        return deriv
+
     def kA_func_doc(self, label):
         r"""
         Calculate heat transfer from heat transfer coefficient.
@@ -478,6 +508,33 @@ class Condenser(HeatExchanger):
             r' + T_\mathrm{out,2}')
         return generate_latex_eq(self, latex, label)
 
+    def ttd_u_deriv(self, increment_filter, k):
+        """
+        Calculate partial derivates of upper terminal temperature function.
+
+        Parameters
+        ----------
+        increment_filter : ndarray
+            Matrix for filtering non-changing variables.
+
+        k : int
+            Position of derivatives in Jacobian matrix (k-th equation).
+        """
+        i = self.inl[0]
+        o = self.outl[1]
+        if self.is_variable(i.p, increment_filter):
+            self.jacobian[k, i.p.J_col] = -dT_sat_dp(i.p.val_SI, i.fluid_data)
+        if self.is_variable(o.p, increment_filter):
+            self.jacobian[k, o.p.J_col] = dT_mix_dph(
+                o.p.val_SI, o.h.val_SI, o.fluid_data, o.mixing_rule,
+                T0=o.T.val_SI
+            )
+        if self.is_variable(o.h, increment_filter):
+            self.jacobian[k, o.h.J_col] = dT_mix_pdh(
+                o.p.val_SI, o.h.val_SI, o.fluid_data, o.mixing_rule,
+                T0=o.T.val_SI
+            )
+
     def calc_parameters(self):
         r"""Postprocessing parameter calculation."""
         # component parameters
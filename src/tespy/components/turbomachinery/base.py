@@ -15,6 +15,8 @@ from tespy.components.component import Component
 from tespy.components.component import component_registry
 from tespy.tools.data_containers import ComponentProperties as dc_cp
 from tespy.tools.document_models import generate_latex_eq
+from tespy.tools.fluid_properties import isentropic_deriv_pure
+from tespy.tools.fluid_properties.helpers import get_number_of_fluids
 
 
 @component_registry
@@ -234,6 +236,30 @@ class Turbomachine(Component):
                 bus.jacobian[self.outl[0].h.J_col] = 0
             bus.jacobian[self.outl[0].h.J_col] -= self.numeric_deriv(f, 'h', self.outl[0], bus=bus)
 
+    def isentropic_enthalpy_deriv(self):
+        r"""
+        Calculate the partial derivatives of the isentropic outlet enthalpy.
+
+        Returns
+        -------
+        deriv : tuple
+            Partial derivatives of :math:`h_\mathrm{out,s}` to
+            :math:`p_\mathrm{in}`, :math:`h_\mathrm{in}` and
+            :math:`p_\mathrm{out}`, :code:`None` for mixtures or fluid
+            property back ends not providing the required properties. In that
+            case the derivatives have to be calculated numerically.
+        """
+        i = self.inl[0]
+        if get_number_of_fluids(i.fluid_data) != 1:
+            return None
+
+        try:
+            return isentropic_deriv_pure(
+                i.p.val_SI, i.h.val_SI, self.outl[0].p.val_SI, i.fluid_data
+            )
+        except NotImplementedError:
+            return None
+
     def calc_parameters(self):
         r"""Postprocessing parameter calculation."""
         self.P.val = self.inl[0].m.val_SI * (
@@ -251,12 +251,22 @@ class Pump(Turbomachine):
         i = self.inl[0]
         o = self.outl[0]
         f = self.eta_s_func
-        if self.is_variable(i.p, increment_filter):
-            self.jacobian[k, i.p.J_col] = self.numeric_deriv(f, 'p', i)
-        if self.is_variable(o.p, increment_filter):
-            self.jacobian[k, o.p.J_col] = self.numeric_deriv(f, 'p', o)
-        if self.is_variable(i.h, increment_filter):
-            self.jacobian[k, i.h.J_col] = self.numeric_deriv(f, 'h', i)
+        deriv = self.isentropic_enthalpy_deriv()
+        if deriv is not None:
+            dp_i, dh_i, dp_o = deriv
+            if self.is_variable(i.p, increment_filter):
+                self.jacobian[k, i.p.J_col] = -dp_i
+            if self.is_variable(o.p, increment_filter):
+                self.jacobian[k, o.p.J_col] = -dp_o
+            if self.is_variable(i.h, increment_filter):
+                self.jacobian[k, i.h.J_col] = 1 - self.eta_s.val - dh_i
+        else:
+            if self.is_variable(i.p, increment_filter):
+                self.jacobian[k, i.p.J_col] = self.numeric_deriv(f, 'p', i)
+            if self.is_variable(o.p, increment_filter):
+                self.jacobian[k, o.p.J_col] = self.numeric_deriv(f, 'p', o)
+            if self.is_variable(i.h, increment_filter):
+                self.jacobian[k, i.h.J_col] = self.numeric_deriv(f, 'h', i)
         if self.is_variable(o.h, increment_filter):
             self.jacobian[k, o.h.J_col] = self.eta_s.val
 
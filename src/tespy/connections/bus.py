@@ -331,11 +331,13 @@ class Bus:
             if isinstance(c, dict):
                 if 'comp' in c:
                     comp = c['comp']
-                    # default values
+                    # default values, the row is written to the bus table
+                    # once all keys are checked
                     if isinstance(comp, Component):
-                        self.comps.loc[comp] = [
-                            None, np.nan, self.char, np.nan, 'component'
-                        ]
+                        row = {
+                            'param': None, 'P_ref': np.nan, 'char': self.char,
+                            'efficiency': np.nan, 'base': 'component'
+                        }
                     else:
                         msg = 'Keyword "comp" must hold a TESPy component.'
                         logger.error(msg)
@@ -348,7 +350,7 @@ class Bus:
                 for k, v in c.items():
                     if k == 'param':
                         if isinstance(v, str) or v is None:
-                            self.comps.loc[comp, 'param'] = v
+                            row['param'] = v
                         else:
                             msg = (
                                 "The bus parameter selection must be a string "
@@ -363,12 +365,11 @@ class Bus:
                         except (TypeError, ValueError):
                             is_numeric = False
                         if isinstance(v, CharLine):
-                            self.comps.loc[comp, 'char'] = v
+                            row['char'] = v
                         elif is_numeric:
                             x = np.array([0, 3])
                             y = np.array([1, 1]) * v
-                            self.comps.loc[comp, 'char'] = (
-                                    CharLine(x=x, y=y))
+                            row['char'] = CharLine(x=x, y=y)
                         else:
                             msg = (
                                 'Char must be a number or a TESPy '
@@ -383,7 +384,7 @@ class Bus:
                         except (TypeError, ValueError):
                             is_numeric = False
                         if v is None or is_numeric:
-                            self.comps.loc[comp, 'P_ref'] = v
+                            row['P_ref'] = np.nan if v is None else v
                         else:
                             msg = 'Reference value must be numeric.'
                             logger.error(msg)
@@ -391,13 +392,15 @@ class Bus:
 
                     elif k == 'base':
                         if v in ['bus', 'component']:
-                            self.comps.loc[comp, 'base'] = v
+                            row['base'] = v
                         else:
                             msg = (
                                 'The base value must be "bus" or "component".')
                             logger.error(msg)
                             raise ValueError(msg)
 
+                self.comps.loc[comp] = [row[col] for col in self.comps.columns]
+
             else:
                 msg = (
                     'Provide arguments as dictionaries. See the documentation '
@@ -269,6 +269,7 @@ class Connection:
         self.property_data0 = [x + '0' for x in self.property_data.keys()]
         self.__dict__.update(self.property_data)
         self.mixing_rule = None
+        self._property_cache = {}
         msg = (
             f"Created connection from {self.source.label} ({self.source_id}) "
             f"to {self.target.label} ({self.target_id})."
@@ -591,7 +592,23 @@ class Connection:
             "printout", "mixing_rule"
         ]
 
-    def _create_fluid_wrapper(self):
+    def _create_fluid_wrapper(self, wrappers=None):
+        r"""
+        Create the fluid property wrappers of the connection's fluids.
+
+        Parameters
+        ----------
+        wrappers : dict
+            Wrapper instances indexed by engine, fluid and back end. Missing
+            wrappers are created and added to the dictionary, existing
+            wrappers are reused. If not provided, new instances are created.
+
+        Note
+        ----
+        The wrappers update their AbstractState on every property call, i.e.
+        connections sharing a wrapper must not be evaluated concurrently.
+        Wrappers provided by the user are not replaced.
+        """
         for fluid in self.fluid.val:
             if fluid in self.fluid.wrapper:
                 continue
@@ -604,7 +621,14 @@ class Connection:
             else:
                 self.fluid.back_end[fluid] = None
 
-            self.fluid.wrapper[fluid] = self.fluid.engine[fluid](fluid, back_end)
+            engine = self.fluid.engine[fluid]
+            if wrappers is None:
+                self.fluid.wrapper[fluid] = engine(fluid, back_end)
+            else:
+                key = (engine, fluid, back_end)
+                if key not in wrappers:
+                    wrappers[key] = engine(fluid, back_end)
+                self.fluid.wrapper[fluid] = wrappers[key]
 
     def preprocess(self):
         self.num_eq = 0
@@ -621,6 +645,7 @@ class Connection:
 
         self.residual = np.zeros(self.num_eq)
         self.jacobian = {}
+        self._property_cache = {}
 
     def simplify_specifications(self):
         systemvar_specs = []
@@ -713,6 +738,7 @@ class Connection:
                 "mass_fraction": self.fluid.val[fluid]
             } for fluid in self.fluid.val
         }
+        self._property_cache = {}
 
     def primary_ref_func(self, k, **kwargs):
         variable = kwargs["variable"]
@@ -732,10 +758,25 @@ class Connection:
         if ref.obj.get_attr(variable).is_var:
             self.jacobian[k, ref.obj.get_attr(variable).J_col] = -ref.factor
 
+    def _calc_cached_property(self, prop, func, T0=None):
+        # the property value of the last pressure and enthalpy values is kept
+        # as several equations evaluate it within the same iteration, the
+        # cache is reset whenever the fluid data are rebuilt. T0 is only a
+        # starting value for the inverse calculation of mixture properties and
+        # therefore deliberately ignored on a cache hit
+        p, h = self.p.val_SI, self.h.val_SI
+        cached = self._property_cache.get(prop)
+        if cached is not None and cached[0] == p and cached[1] == h:
+            return cached[2]
+
+        value = func(p, h, self.fluid_data, self.mixing_rule, T0=T0)
+        self._property_cache[prop] = (p, h, value)
+        return value
+
     def calc_T(self, T0=None):
         if T0 is None:
             T0 = self.T.val_SI
-        return T_mix_ph(self.p.val_SI, self.h.val_SI, self.fluid_data, self.mixing_rule, T0=T0)
+        return self._calc_cached_property("T", T_mix_ph, T0=T0)
 
     def T_func(self, k, **kwargs):
         self.residual[k] = self.calc_T() - self.T.val_SI
@@ -780,14 +821,15 @@ class Connection:
 
     def calc_viscosity(self, T0=None):
         try:
-            return viscosity_mix_ph(self.p.val_SI, self.h.val_SI, self.fluid_data, self.mixing_rule, T0=T0)
+            return self._calc_cached_property(
+                "viscosity", viscosity_mix_ph, T0=T0
+            )
         except NotImplementedError:
             return np.nan
 
-
     def calc_vol(self, T0=None):
         try:
-            return v_mix_ph(self.p.val_SI, self.h.val_SI, self.fluid_data, self.mixing_rule, T0=T0)
+            return self._calc_cached_property("v", v_mix_ph, T0=T0)
         except NotImplementedError:
             return np.nan
 
@@ -1064,7 +1106,7 @@ class Connection:
         )
         return msg
 
-    def get_physical_exergy(self, pamb, Tamb):
+    def get_physical_exergy(self, pamb, Tamb, ambient_state=None):
         r"""
         Get the value of a connection's specific physical exergy.
 
@@ -1076,6 +1118,10 @@ class Connection:
         T0 : float
             Ambient temperature T0 / K.
 
+        ambient_state : tuple
+            Specific enthalpy and entropy of the connection's fluid at ambient
+            state, calculated if not provided.
+
         Note
         ----
             .. math::
@@ -1087,7 +1133,8 @@ class Connection:
         """
         self.ex_therm, self.ex_mech = fp.functions.calc_physical_exergy(
             self.h.val_SI, self.s.val_SI, self.p.val_SI, pamb, Tamb,
-            self.fluid_data, self.mixing_rule, self.T.val_SI
+            self.fluid_data, self.mixing_rule, self.T.val_SI,
+            ambient_state=ambient_state
         )
         self.Ex_therm = self.ex_therm * self.m.val_SI
         self.Ex_mech = self.ex_mech * self.m.val_SI
@@ -178,6 +178,8 @@ class Network:
             columns=list(dtypes.keys())
         ).astype(dtypes)
         self.all_fluids = set()
+        # fluid property wrappers shared by the connections of the network
+        self.fluid_wrappers = {}
         # component dataframe
         dtypes = {
             "comp_type": str,
@@ -965,7 +967,7 @@ class Network:
                 for f, back_end in back_ends.items():
                     c.fluid.back_end[f] = back_end
 
-                c._create_fluid_wrapper()
+                c._create_fluid_wrapper(self.fluid_wrappers)
 
     def presolve_massflow_topology(self):
 
@@ -352,6 +352,8 @@ def _construct_connections(data, comps):
 
     module_name = "tespy.tools.fluid_properties.wrappers"
     _ = importlib.import_module(module_name)
+    # shared by the connections of the imported network
+    wrappers = {}
 
     for label, conn in data.items():
         conns[label] = Connection(
@@ -370,7 +372,7 @@ def _construct_connections(data, comps):
             conn["fluid"]["engine"][f] = wrapper_registry.items[engine]
 
         conns[label].fluid.set_attr(**conn["fluid"])
-        conns[label]._create_fluid_wrapper()
+        conns[label]._create_fluid_wrapper(wrappers)
 
     for label, conn in data.items():
         for arg in arglist_ref:
@@ -21,6 +21,7 @@ from tabulate import tabulate
 from tespy.tools import helpers as hlp
 from tespy.tools import logger
 from tespy.tools.fluid_properties import single_fluid
+from tespy.tools.fluid_properties.functions import calc_ambient_state
 from tespy.tools.global_vars import ERR
 from tespy.tools.global_vars import combustion_gases
 
@@ -321,6 +322,8 @@ class ExergyAnalysis:
         bus_labels = [b.label for b in internal_busses + E_F + E_P + E_L]
         key_exergy_labels = ['E_P', 'E_F', 'E_D', 'E_L']
         self.reserved_fkt_groups = key_exergy_labels + bus_labels
+        # set for the membership checks, the list keeps the order
+        self._reserved_fkt_group_set = frozenset(self.reserved_fkt_groups)
         if len(set(bus_labels).intersection(key_exergy_labels)) > 0:
             msg = (
                 "None of your busses may have the label '"
@@ -329,7 +332,7 @@ class ExergyAnalysis:
             )
             raise ValueError(msg)
 
-    def analyse(self, pamb, Tamb, Chem_Ex=None):
+    def analyse(self, pamb, Tamb, Chem_Ex=None, create_groups=True):
         """Run the exergy analysis.
 
         Parameters
@@ -341,6 +344,15 @@ class ExergyAnalysis:
         Tamb : float
             Ambient temperature value for analysis, provide value in network's
             temperature unit.
+
+        create_groups : boolean
+            Create the component group data and complete the sankey data,
+            default value :code:`True`. If :code:`False`, the group data are
+            created on demand by
+            :py:meth:`tespy.tools.analyses.ExergyAnalysis.print_results` and
+            :py:meth:`tespy.tools.analyses.ExergyAnalysis.generate_plotly_sankey_input`
+            or by calling
+            :py:meth:`tespy.tools.analyses.ExergyAnalysis.create_group_data`.
         """
         pamb_SI = hlp.convert_to_SI('p', pamb, self.nw.p_unit)
         Tamb_SI = hlp.convert_to_SI('T', Tamb, self.nw.T_unit)
@@ -353,31 +365,35 @@ class ExergyAnalysis:
             "epsilon": float,
             "group": str
         }
-        self.component_data = pd.DataFrame(
-            columns=list(dtypes.keys())
-        ).astype(dtypes)
-
-        self.bus_data = self.component_data.copy()
-        self.bus_data["base"] = np.nan
-        self.bus_data["base"] = self.bus_data["base"].astype(str)
+        bus_dtypes = dtypes.copy()
+        bus_dtypes["base"] = str
         conn_exergy_data_cols = ['e_PH', 'e_T', 'e_M', 'E_PH', 'E_T', 'E_M']
 
         if Chem_Ex is not None:
             conn_exergy_data_cols += ['e_CH', 'E_CH']
 
-        self.connection_data = pd.DataFrame(
-            columns=conn_exergy_data_cols,
-            dtype='float64'
-        )
-
-        self.network_data = pd.Series(
-            index=['E_F', 'E_P', 'E_D', 'E_L'], dtype='float64'
-        )
-        self.network_data[:] = 0
+        # network exergy values are summed up as plain floats by
+        # _evaluate_bus_row, the Series is created after the component loop
+        self._network_exergy = {'E_F': 0., 'E_P': 0., 'E_D': 0., 'E_L': 0.}
 
-        # physical exergy of connections
+        # physical exergy of connections, the rows are collected first and
+        # the DataFrame is created at once afterwards
+        conn_data = {}
+        # the ambient state only depends on the fluid composition, it is
+        # calculated once per composition
+        ambient_states = {}
         for conn in self.nw.conns['object']:
-            conn.get_physical_exergy(pamb_SI, Tamb_SI)
+            composition = (conn.mixing_rule,) + tuple(
+                (fluid, data['wrapper'], data['mass_fraction'])
+                for fluid, data in sorted(conn.fluid_data.items())
+            )
+            if composition not in ambient_states:
+                ambient_states[composition] = calc_ambient_state(
+                    pamb_SI, Tamb_SI, conn.fluid_data, conn.mixing_rule
+                )
+            conn.get_physical_exergy(
+                pamb_SI, Tamb_SI, ambient_states[composition]
+            )
             conn.get_chemical_exergy(pamb_SI, Tamb_SI, Chem_Ex)
             conn_exergy_data = [
                 conn.ex_physical, conn.ex_therm, conn.ex_mech,
@@ -386,7 +402,12 @@ class ExergyAnalysis:
             if Chem_Ex is not None:
                 conn_exergy_data += [conn.ex_chemical, conn.Ex_chemical]
 
-            self.connection_data.loc[conn.label] = conn_exergy_data
+            conn_data[conn.label] = conn_exergy_data
+
+        self.connection_data = pd.DataFrame(
+            list(conn_data.values()), index=list(conn_data.keys()),
+            columns=conn_exergy_data_cols, dtype='float64'
+        )
 
         # todo: überprüfen der sankey data + massless exergy
         self.sankey_data = {}
@@ -405,15 +426,29 @@ class ExergyAnalysis:
                 )
             ).astype(sankey_columns_dtypes)
 
+        # bases of the components on the busses of the analysis, indexed once
+        # for the lookups in _evaluate_bus_row
+        self._bus_comps = []
+        self._comps_on_busses = set()
+        for kind, busses in [
+                ('E_F', self.E_F), ('E_P', self.E_P),
+                ('internal', self.internal_busses), ('E_L', self.E_L)
+        ]:
+            for b in busses:
+                self._bus_comps += [(b, kind, b.comps['base'].to_dict())]
+                self._comps_on_busses.update(b.comps.index)
+
         # exergy balance of components
+        comp_data = {}
+        bus_data = {}
         for cp in self.nw.comps['object']:
             # save component information
             cp.exergy_balance(Tamb_SI)
-            self.component_data.loc[cp.label] = [
+            comp_data[cp.label] = [
                 cp.E_F, cp.E_P, cp.E_D, cp.epsilon, cp.fkt_group
             ]
 
-            if cp.fkt_group in self.reserved_fkt_groups:
+            if cp.fkt_group in self._reserved_fkt_group_set:
                 msg = (
                     'The labels ' + ', '.join(self.reserved_fkt_groups) + ' '
                     'cannot be used by components (if no group was assigned) '
@@ -431,7 +466,18 @@ class ExergyAnalysis:
                     )
                 ).astype(sankey_columns_dtypes)
 
-            self.evaluate_busses(cp)
+            bus_row = self._evaluate_bus_row(cp)
+            if bus_row is not None:
+                bus_data[cp.label] = bus_row
+
+        self.component_data = pd.DataFrame(
+            list(comp_data.values()), index=list(comp_data.keys()),
+            columns=list(dtypes.keys())
+        ).astype(dtypes)
+        self.bus_data = pd.DataFrame(
+            list(bus_data.values()), index=list(bus_data.keys()),
+            columns=list(bus_dtypes.keys())
+        ).astype(bus_dtypes)
 
         # create a table that includes exergy destruction attributed to the
         # components
@@ -457,10 +503,12 @@ class ExergyAnalysis:
         )
 
         # calculate network results
-        self.network_data.loc['E_D'] = (
+        network_exergy = self._network_exergy
+        network_exergy['E_D'] = (
             self.component_data['E_D'].sum() + self.bus_data['E_D'].sum())
-        self.network_data.loc['E_F'] = abs(self.network_data.loc['E_F'])
-        self.network_data.loc['E_P'] = abs(self.network_data.loc['E_P'])
+        network_exergy['E_F'] = abs(network_exergy['E_F'])
+        network_exergy['E_P'] = abs(network_exergy['E_P'])
+        self.network_data = pd.Series(network_exergy, dtype='float64')
         self.network_data.loc['epsilon'] = (
             self.network_data.loc['E_P'] / self.network_data.loc['E_F']
         )
@@ -469,10 +517,16 @@ class ExergyAnalysis:
         E_F = self.network_data.loc['E_F']
         E_D = self.network_data.loc['E_D']
 
-        for d in [self.component_data, self.bus_data, self.aggregation_data]:
-            d['y_Dk'] = d['E_D'] / E_F
-            d['y*_Dk'] = d['E_D'] / E_D
-            d['epsilon'] = d['E_P'] / d['E_F']
+        # plain arrays skip the index alignment of pandas, the division by
+        # zero yields inf/nan as before
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for d in [
+                    self.component_data, self.bus_data, self.aggregation_data
+            ]:
+                E_D_k = d['E_D'].to_numpy()
+                d['y_Dk'] = E_D_k / E_F
+                d['y*_Dk'] = E_D_k / E_D
+                d['epsilon'] = d['E_P'].to_numpy() / d['E_F'].to_numpy()
 
         residual = abs(
             self.network_data.loc['E_F'] - self.network_data.loc['E_P'] -
@@ -488,19 +542,37 @@ class ExergyAnalysis:
                 'properly setup for the exergy analysis.')
             logger.error(msg)
 
-        self.create_group_data()
+        self.group_data = None
+        if create_groups:
+            self.create_group_data()
 
-    def evaluate_busses(self, cp):
+    def _evaluate_bus_row(self, cp):
         """Evaluate the exergy balances of busses.
 
+        The method is part of
+        :py:meth:`tespy.tools.analyses.ExergyAnalysis.analyse` and relies on
+        the bus lookups and the network exergy values prepared there.
+
         Parameters
         ----------
         cp : tespy.components.component.Component
             Component to analyse the bus exergy balance of.
+
+        Returns
+        -------
+        bus_row : list
+            Bus exergy data of the component (E_F, E_P, E_D, epsilon, group
+            and base), :code:`None` if the component is not connected to any
+            of the busses of the analysis.
         """
+        bus_row = None
+        if cp not in self._comps_on_busses:
+            return bus_row
+
         cp_on_num_busses = 0
-        for b in self.E_F + self.E_P + self.internal_busses + self.E_L:
-            if cp in b.comps.index:
+        for b, kind, bases in self._bus_comps:
+            base = bases.get(cp)
+            if base is not None:
                 if cp_on_num_busses > 0:
                     msg = (
                         'The component ' + cp.label + ' is on multiple '
@@ -510,19 +582,18 @@ class ExergyAnalysis:
                     logger.error(msg)
                     raise hlp.TESPyNetworkError(msg)
                 # todo: E_bus als dict mit den versch. werten
-                if b.comps.loc[cp, 'base'] == 'bus':
+                if base == 'bus':
                     E_bus = sum(e for e in cp.E_bus.values() if e)
-                    self.bus_data.loc[cp.label, 'E_P'] = E_bus
+                    E_P = E_bus
                     bus_efficiency = cp.calc_bus_efficiency(b)
                     E_F = E_bus / bus_efficiency
-                    self.bus_data.loc[cp.label, 'E_F'] = E_F
 
-                    if b in self.E_F:
-                        self.network_data.loc['E_F'] += E_F
-                    elif b in self.E_P:
-                        self.network_data.loc['E_P'] -= E_F
-                    elif b in self.E_L:
-                        self.network_data.loc['E_L'] -= E_F
+                    if kind == 'E_F':
+                        self._network_exergy['E_F'] += E_F
+                    elif kind == 'E_P':
+                        self._network_exergy['E_P'] -= E_F
+                    elif kind == 'E_L':
+                        self._network_exergy['E_L'] -= E_F
 
                     for key, value in cp.E_bus.items():
                         if value == 0:
@@ -542,15 +613,14 @@ class ExergyAnalysis:
                     E_bus = sum(e for e in cp.E_bus.values() if e)
                     bus_efficiency = cp.calc_bus_efficiency(b)
                     E_P = E_bus * bus_efficiency
-                    self.bus_data.loc[cp.label, 'E_P'] = E_P
-                    self.bus_data.loc[cp.label, 'E_F'] = E_bus
+                    E_F = E_bus
 
-                    if b in self.E_F:
-                        self.network_data.loc['E_F'] -= E_P
-                    elif b in self.E_P:
-                        self.network_data.loc['E_P'] += E_P
-                    elif b in self.E_L:
-                        self.network_data.loc['E_L'] += E_P
+                    if kind == 'E_F':
+                        self._network_exergy['E_F'] -= E_P
+                    elif kind == 'E_P':
+                        self._network_exergy['E_P'] += E_P
+                    elif kind == 'E_L':
+                        self._network_exergy['E_L'] += E_P
 
                     for key, value in cp.E_bus.items():
                         if value == 0:
@@ -567,19 +637,28 @@ class ExergyAnalysis:
 
                         self.sankey_data[cp.fkt_group].loc[(b.label, category), key] += value * bus_efficiency
 
-                self.bus_data.loc[cp.label, 'base'] = b.comps.loc[cp, 'base']
-                self.bus_data.loc[cp.label, 'group'] = cp.fkt_group
+                bus_row = [
+                    E_F, E_P, E_F - E_P, np.nan, cp.fkt_group, base
+                ]
 
                 cp_on_num_busses += 1
 
-        self.bus_data['E_D'] = self.bus_data['E_F'] - self.bus_data['E_P']
+        return bus_row
 
     def create_group_data(self):
-        """Collect the component group exergy data."""
+        """Collect the component group exergy data.
+
+        The group data are created once per analysis, further calls do not
+        change the sankey data or the group data.
+        """
+        if self.group_data is not None:
+            return
+
+        group_E_D = self.aggregation_data.groupby(
+            'group', sort=False
+        )['E_D'].sum().to_dict()
         for group in self.sankey_data.keys():
-            E_D = self.aggregation_data[
-                self.aggregation_data['group'] == group
-            ]['E_D'].sum()
+            E_D = group_E_D.get(group, 0.)
             self.sankey_data[group].loc[('E_D', "E_D"), :] = [0., 0., E_D]
         # establish connections for fuel exergy via bus balance
         for b in self.E_F:
@@ -605,51 +684,59 @@ class ExergyAnalysis:
                 - self.sankey_data[b.label].loc[:, self.exergy_cats].sum()
             )
 
+        # lookup of the outgoing connections and the group of every
+        # component instead of filtering the tables per component
+        outgoing_conns = {}
+        for conn in self.nw.conns['object']:
+            outgoing_conns.setdefault(conn.source.label, []).append(conn)
+        comp_groups = self.component_data['group'].to_dict()
+        group_comps = self.component_data.groupby('group', sort=False).groups
+
         for fkt_group, data in self.sankey_data.items():
-            mask = self.component_data['group'] == fkt_group
-            comps = self.component_data.loc[mask].index
+            comps = group_comps.get(fkt_group, [])
+            # sum up the flows in a plain dict and write every target once
+            flows = {}
             for comp in comps:
-                comp_obj = self.nw.get_comp(comp)
-                sources = self.nw.conns[self.nw.conns['source'] == comp_obj]
-                for conn in sources['object']:
+                for conn in outgoing_conns.get(comp, []):
                     if conn.target.label not in comps:
-                        target_group = self.component_data.loc[conn.target.label, 'group']
+                        target_group = comp_groups[conn.target.label]
                         target_value_chemical = (
                             conn.Ex_chemical
                             if hasattr(conn, "Ex_chemical") else 0.
                         )
                         target_value_physical = conn.Ex_physical
                         cat = categorize_fluids(conn)
-                        if (target_group, cat) in data.index:
-                            self.sankey_data[fkt_group].loc[
-                                (target_group, cat), 'physical'] += target_value_physical
-                            self.sankey_data[fkt_group].loc[
-                                (target_group, cat), 'chemical'] += target_value_chemical
-                        else:
-                            self.sankey_data[fkt_group].loc[(target_group, cat), :] = [
-                                target_value_chemical, target_value_physical, 0
-                            ]
+                        flow = flows.setdefault((target_group, cat), [0., 0.])
+                        flow[0] += target_value_chemical
+                        flow[1] += target_value_physical
+
+            for target, (chemical, physical) in flows.items():
+                if target in data.index:
+                    data.loc[target, 'physical'] += physical
+                    data.loc[target, 'chemical'] += chemical
+                else:
+                    data.loc[target, :] = [chemical, physical, 0]
 
         # create overview of component groups
+        group_data = {}
+        for fkt_group in self.component_data['group'].unique():
+            group_data[fkt_group] = [
+                self.calculate_group_input_value(fkt_group).sum().sum(),
+                np.nan,
+                self.sankey_data[fkt_group].loc[idx['E_D', :], self.exergy_cats].sum().sum()
+            ]
+
         self.group_data = pd.DataFrame(
+            list(group_data.values()), index=list(group_data.keys()),
             columns=['E_in', 'E_out', 'E_D'], dtype='float64'
         )
 
-        for fkt_group in self.component_data['group'].unique():
-            self.group_data.loc[fkt_group, 'E_in'] = (
-                self.calculate_group_input_value(fkt_group).sum().sum()
-            )
-            self.group_data.loc[fkt_group, 'E_D'] = (
-                self.sankey_data[fkt_group].loc[idx['E_D', :], self.exergy_cats].sum().sum()
-            )
-
         # calculate missing values
-        self.group_data['E_out'] = (
-            self.group_data['E_in'] - self.group_data['E_D'])
-        self.group_data['y_Dk'] = (
-            self.group_data['E_D'] / self.network_data.loc['E_F'])
-        self.group_data['y*_Dk'] = (
-            self.group_data['E_D'] / self.network_data.loc['E_D'])
+        E_D_k = self.group_data['E_D'].to_numpy()
+        self.group_data['E_out'] = self.group_data['E_in'].to_numpy() - E_D_k
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.group_data['y_Dk'] = E_D_k / self.network_data.loc['E_F']
+            self.group_data['y*_Dk'] = E_D_k / self.network_data.loc['E_D']
 
         # ToDo: Transform this into a test
         # assert self.group_data['E_D'].sum() == self.network_data["E_D"]
@@ -688,7 +775,7 @@ class ExergyAnalysis:
             Dictionary containing the modified component group data.
         """
         for fkt_group in group_data.copy().keys():
-            if fkt_group in self.reserved_fkt_groups:
+            if fkt_group in self._reserved_fkt_group_set:
                 continue
             source_groups = self.single_group_input(fkt_group, group_data)
             if len(source_groups) == 1 and len(group_data[fkt_group].index.get_level_values("target_group").unique()) == 1:
@@ -747,6 +834,9 @@ class ExergyAnalysis:
             Tuple containing the links and node_order for the plotly sankey
             diagram.
         """
+        if self.group_data is None:
+            self.create_group_data()
+
         group_data = self.sankey_data.copy()
         cols = self.exergy_cats
         for fkt_group, data in self.sankey_data.items():
@@ -848,30 +938,30 @@ class ExergyAnalysis:
                 tablefmt='psql', floatfmt='.3e'))
 
         if components:
-            df = self.component_data.copy()
+            df = self.component_data
             df = df.loc[:, df.columns != 'group']
             if sort_desc:
-                df.sort_values(by=['E_D'], ascending=False, inplace=True)
+                df = df.sort_values(by=['E_D'], ascending=False)
 
             print('##### RESULTS: Component exergy analysis #####')
             print(tabulate(
                 df, headers='keys', tablefmt='psql', floatfmt='.3e'))
 
         if busses:
-            df = self.bus_data.copy()
+            df = self.bus_data
             df = df.loc[:, (df.columns != 'group') & (df.columns != 'base')]
             if sort_desc:
-                df.sort_values(by=['E_D'], ascending=False, inplace=True)
+                df = df.sort_values(by=['E_D'], ascending=False)
 
             print('##### RESULTS: Bus exergy analysis #####')
             print(tabulate(
                 df, headers='keys', tablefmt='psql', floatfmt='.3e'))
 
         if aggregation:
-            df = self.aggregation_data.copy()
+            df = self.aggregation_data
             df = df.loc[:, df.columns != 'group']
             if sort_desc:
-                df.sort_values(by=['E_D'], ascending=False, inplace=True)
+                df = df.sort_values(by=['E_D'], ascending=False)
 
             print('##### RESULTS: Aggregation of components and busses #####')
             print(tabulate(
@@ -885,9 +975,12 @@ class ExergyAnalysis:
                 showindex=False))
 
         if groups:
-            df = self.group_data.copy()
+            if self.group_data is None:
+                self.create_group_data()
+
+            df = self.group_data
             if sort_desc:
-                df.sort_values(by=['E_D'], ascending=False, inplace=True)
+                df = df.sort_values(by=['E_D'], ascending=False)
 
             print('##### RESULTS: Functional groups exergy flows #####')
             print(tabulate(
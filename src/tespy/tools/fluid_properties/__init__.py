@@ -13,6 +13,7 @@ from .functions import dv_mix_pdh  # noqa: F401
 from .functions import h_mix_pQ  # noqa: F401
 from .functions import h_mix_pT  # noqa: F401
 from .functions import isentropic  # noqa: F401
+from .functions import isentropic_deriv_pure  # noqa: F401
 from .functions import s_mix_ph  # noqa: F401
 from .functions import s_mix_pT  # noqa: F401
 from .functions import v_mix_ph  # noqa: F401
@@ -34,7 +34,73 @@ def isentropic(p_1, h_1, p_2, fluid_data, mixing_rule=None, T0=None):
         return h_mix_pT(p_2, T_2, fluid_data, mixing_rule)
 
 
-def calc_physical_exergy(h, s, p, pamb, Tamb, fluid_data, mixing_rule=None, T0=None):
+def isentropic_deriv_pure(p_1, h_1, p_2, fluid_data):
+    r"""
+    Calculate the partial derivatives of the isentropic outlet enthalpy.
+
+    The derivatives follow from :math:`dh = T \cdot ds + v \cdot dp` and are
+    only available for pure fluids.
+
+    Parameters
+    ----------
+    p_1 : float
+        Inlet pressure p_1 / Pa.
+
+    h_1 : float
+        Inlet specific enthalpy h_1 / (J/kg).
+
+    p_2 : float
+        Outlet pressure p_2 / Pa.
+
+    fluid_data : dict
+        Fluid data of the connection, must contain a single fluid.
+
+    Returns
+    -------
+    deriv : tuple
+        Partial derivatives of :math:`h_{2,s}` to :math:`p_1`, :math:`h_1`
+        and :math:`p_2`.
+
+        .. math::
+
+            \frac{\partial h_{2,s}}{\partial p_1} =
+            -\frac{T_{2,s} \cdot v_1}{T_1}\\
+            \frac{\partial h_{2,s}}{\partial h_1} = \frac{T_{2,s}}{T_1}\\
+            \frac{\partial h_{2,s}}{\partial p_2} = v_{2,s}
+    """
+    wrapper = get_pure_fluid(fluid_data)["wrapper"]
+    v_1 = 1 / wrapper.d_ph(p_1, h_1)
+    T_1 = wrapper.T_ph(p_1, h_1)
+    h_2 = wrapper.isentropic(p_1, h_1, p_2)
+    T_2 = wrapper.T_ph(p_2, h_2)
+    v_2 = 1 / wrapper.d_ph(p_2, h_2)
+    return -T_2 * v_1 / T_1, T_2 / T_1, v_2
+
+
+def calc_ambient_state(pamb, Tamb, fluid_data, mixing_rule=None):
+    r"""
+    Calculate specific enthalpy and entropy at ambient conditions.
+
+    Parameters
+    ----------
+    pamb : float
+        Ambient pressure p0 / Pa.
+
+    Tamb : float
+        Ambient temperature T0 / K.
+
+    Returns
+    -------
+    ambient_state : tuple
+        Specific enthalpy and entropy at ambient state
+        (:math:`h\left(p_0,T_0\right)`, :math:`s\left(p_0,T_0\right)`).
+    """
+    h0 = h_mix_pT(pamb, Tamb, fluid_data, mixing_rule)
+    s0 = s_mix_pT(pamb, Tamb, fluid_data, mixing_rule)
+    return h0, s0
+
+
+def calc_physical_exergy(h, s, p, pamb, Tamb, fluid_data, mixing_rule=None, T0=None, ambient_state=None):
     r"""
     Calculate specific physical exergy.
 
@@ -49,6 +115,10 @@ def calc_physical_exergy(h, s, p, pamb, Tamb, fluid_data, mixing_rule=None, T0=N
     Tamb : float
         Ambient temperature T0 / K.
 
+    ambient_state : tuple
+        Specific enthalpy and entropy at ambient state as returned by
+        :py:func:`calc_ambient_state`. It is calculated if not provided.
+
     Returns
     -------
     e_ph : tuple
@@ -68,8 +138,9 @@ def calc_physical_exergy(h, s, p, pamb, Tamb, fluid_data, mixing_rule=None, T0=N
     h_T0_p = h_mix_pT(p, Tamb, fluid_data, mixing_rule)
     s_T0_p = s_mix_pT(p, Tamb, fluid_data, mixing_rule)
     ex_therm = (h - h_T0_p) - Tamb * (s - s_T0_p)
-    h0 = h_mix_pT(pamb, Tamb, fluid_data, mixing_rule)
-    s0 = s_mix_pT(pamb, Tamb, fluid_data, mixing_rule)
+    if ambient_state is None:
+        ambient_state = calc_ambient_state(pamb, Tamb, fluid_data, mixing_rule)
+    h0, s0 = ambient_state
     ex_mech = (h_T0_p - h0) - Tamb * (s_T0_p - s0)
     return ex_therm, ex_mech
 
@@ -185,6 +185,47 @@ class TestClausiusRankine:
         )
         assert check == checksum, msg
 
+    def test_exergy_analysis_deferred_group_data(self):
+        """Test exergy analysis without creating the group data directly."""
+        ean = ExergyAnalysis(
+            self.nw, E_P=[self.power], E_F=[self.heat],
+            internal_busses=[self.fwp_power])
+        ean.analyse(pamb=self.pamb, Tamb=self.Tamb)
+        links, _ = ean.generate_plotly_sankey_input()
+        group_data = ean.group_data.copy()
+
+        ean.analyse(pamb=self.pamb, Tamb=self.Tamb, create_groups=False)
+        msg = 'The group data must not be created in the analysis.'
+        assert ean.group_data is None, msg
+
+        links_deferred, _ = ean.generate_plotly_sankey_input()
+        msg = 'The group data must be created on demand.'
+        assert group_data.equals(ean.group_data), msg
+        msg = 'The sankey links must not depend on the time of creation.'
+        assert links == links_deferred, msg
+
+    def test_exergy_analysis_repeated_group_data(self):
+        """Test repeated creation of the group data."""
+        ean = ExergyAnalysis(
+            self.nw, E_P=[self.power], E_F=[self.heat],
+            internal_busses=[self.fwp_power])
+        ean.analyse(pamb=self.pamb, Tamb=self.Tamb)
+        group_data = ean.group_data.copy()
+        sankey_data = {
+            group: data.copy() for group, data in ean.sankey_data.items()
+        }
+
+        ean.create_group_data()
+        ean.create_group_data()
+        msg = 'The group data must not change when created repeatedly.'
+        assert group_data.equals(ean.group_data), msg
+        for group, data in sankey_data.items():
+            msg = (
+                f'The sankey data of group {group} must not change when the '
+                'group data are created repeatedly.'
+            )
+            assert data.equals(ean.sankey_data[group]), msg
+
     def test_exergy_analysis_violated_balance(self):
         """Test exergy analysis with violated balance."""
         # specify efficiency values for the internal bus
@@ -23,6 +23,7 @@ from tespy.components import Source
 from tespy.connections import Bus
 from tespy.connections import Connection
 from tespy.networks import Network
+from tespy.tools.fluid_properties import h_mix_pT
 
 
 class TestHeatExchangers:
@@ -479,6 +480,64 @@ class TestHeatExchangers:
         )
         assert round(self.c3.m.val, 2) == 7.96
 
+    def check_derivatives(self, instance, functions, jacobians):
+        """Compare the Jacobian entries with the numerical derivatives."""
+        for func, deriv in functions:
+            instance.jacobian = jacobians[func.__name__]
+            deriv(None, 0)
+            for c in instance.inl + instance.outl:
+                for var in ['p', 'h']:
+                    if c.get_attr(var).is_var:
+                        numeric = instance.numeric_deriv(func, var, c)
+                        col = c.get_attr(var).J_col
+                        analytic = instance.jacobian.get((0, col), 0)
+                        msg = (
+                            f'Derivative of {func.__name__} to {var} of '
+                            f'connection {c.label} must be {numeric}, is '
+                            f'{analytic}.'
+                        )
+                        assert math.isclose(numeric, analytic, rel_tol=1e-5), msg
+
+    def test_HeatExchanger_derivatives(self, tmp_path):
+        """Test analytical derivatives of temperature difference equations."""
+        instance = HeatExchanger('heat exchanger')
+        self.setup_HeatExchanger_network(instance)
+
+        instance.set_attr(
+            pr1=0.98, pr2=0.98, design=['pr1', 'pr2'],
+            offdesign=['zeta1', 'zeta2', 'kA_char']
+        )
+        self.c1.set_attr(T=200, p=5, m=5, fluid={'air': 1})
+        self.c2.set_attr(T=80)
+        self.c3.set_attr(T=30, p=3, fluid={'H2O': 1})
+        self.c4.set_attr(T=45)
+        self.nw.solve('design')
+        self.nw._convergence_check()
+        self.nw.save(tmp_path)
+
+        self.c2.set_attr(T=None)
+        self.nw.solve('offdesign', design_path=tmp_path)
+        self.nw._convergence_check()
+
+        functions = [
+            (instance.kA_func, instance.kA_deriv),
+            (instance.kA_char_func, instance.kA_char_deriv),
+            (instance.ttd_u_func, instance.ttd_u_deriv),
+            (instance.ttd_l_func, instance.ttd_l_deriv)
+        ]
+        jacobians = {func.__name__: {} for func, _ in functions}
+        # the second state has a cold side outlet temperature above the hot
+        # side inlet temperature, the upper terminal temperature difference is
+        # fixed by the manipulation in calculate_td_log, the entries of the
+        # first state must be overwritten
+        for T_o2 in [None, 483.15]:
+            if T_o2 is not None:
+                self.c4.h.val_SI = h_mix_pT(
+                    self.c4.p.val_SI, T_o2, self.c4.fluid_data
+                )
+
+            self.check_derivatives(instance, functions, jacobians)
+
     def test_HeatExchanger_effectiveness_invalid(self):
 
         instance = HeatExchanger('heat exchanger')
@@ -579,6 +638,35 @@ class TestHeatExchangers:
                str(round(self.c1.p.val_SI, 5)) + '.')
         assert p == round(self.c1.p.val_SI, 5), msg
 
+    def test_Condenser_derivatives(self, tmp_path):
+        """Test derivatives of the condenser specific equations."""
+        instance = Condenser('condenser')
+        self.setup_HeatExchanger_network(instance)
+
+        instance.set_attr(
+            pr1=0.98, pr2=0.98, ttd_u=5, design=['pr2', 'ttd_u'],
+            offdesign=['zeta2', 'kA_char']
+        )
+        self.c1.set_attr(T=100, p0=0.5, fluid={'H2O': 1})
+        self.c3.set_attr(T=30, p=5, fluid={'H2O': 1})
+        self.c4.set_attr(T=40)
+        instance.set_attr(Q=-80e3)
+        self.nw.solve('design')
+        self.nw._convergence_check()
+        self.nw.save(tmp_path)
+
+        instance.set_attr(Q=-60e3)
+        self.nw.solve('offdesign', design_path=tmp_path)
+        self.nw._convergence_check()
+
+        functions = [
+            (instance.kA_func, instance.kA_deriv),
+            (instance.kA_char_func, instance.kA_char_deriv),
+            (instance.ttd_u_func, instance.ttd_u_deriv)
+        ]
+        jacobians = {func.__name__: {} for func, _ in functions}
+        self.check_derivatives(instance, functions, jacobians)
+
     def test_CondenserWithEvaporation(self):
         """Test a Condenser that evaporates a fluid."""
         instance = Condenser('condenser')
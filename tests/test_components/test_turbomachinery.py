@@ -10,6 +10,8 @@ tests/test_components/test_turbomachinery.py
 SPDX-License-Identifier: MIT
 """
 
+import math
+
 import numpy as np
 
 from tespy.components import Compressor
@@ -329,6 +331,49 @@ class TestTurbomachinery:
                ') must be (' + str(eta_s) + ').')
         assert eta_s == round(instance.eta_s.val, 3), msg
 
+    def test_eta_s_derivatives(self):
+        """Test analytical derivatives of isentropic efficiency equations."""
+        cases = [
+            (
+                Turbine('turbine'),
+                {'m': 10, 'T': 500, 'p0': 100, 'fluid': {'water': 1}},
+                {'x': 0.9, 'p0': 0.1},
+                {'pr': 1e-3, 'eta_s': 0.85}
+            ),
+            (
+                Compressor('compressor'),
+                {'m': 1, 'T': 0, 'p0': 2, 'fluid': {'R134a': 1}},
+                {'T': 60},
+                {'pr': 5, 'eta_s': 0.8}
+            ),
+            (
+                Pump('pump'),
+                {'m': 1, 'T': 20, 'p0': 1, 'fluid': {'water': 1}},
+                {'T': 20.5},
+                {'pr': 100, 'eta_s': 0.7}
+            )
+        ]
+        for instance, inlet, outlet, params in cases:
+            self.setup_network(instance)
+            self.c1.set_attr(**inlet)
+            self.c2.set_attr(**outlet)
+            instance.set_attr(**params)
+            self.nw.solve('design')
+            self.nw._convergence_check()
+
+            instance.jacobian = {}
+            instance.eta_s_deriv(None, 0)
+            for c, var in [(self.c1, 'p'), (self.c1, 'h'), (self.c2, 'p')]:
+                numeric = instance.numeric_deriv(instance.eta_s_func, var, c)
+                analytic = instance.jacobian[0, c.get_attr(var).J_col]
+                msg = (
+                    f'Derivative of eta_s_func of {instance.label} to {var} '
+                    f'of connection {c.label} must be {numeric}, is '
+                    f'{analytic}.'
+                )
+                # the numerical derivative of the liquid states is less exact
+                assert math.isclose(numeric, analytic, rel_tol=1e-3), msg
+
     def test_Turbomachine(self):
         """Test component properties of turbomachines."""
         instance = Turbomachine('turbomachine')
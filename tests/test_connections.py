@@ -10,14 +10,87 @@ tests/test_busses.py
 SPDX-License-Identifier: MIT
 """
 
+import math
+
 from tespy.components import Sink
 from tespy.components import Source
 from tespy.connections import Connection
 from tespy.connections import Ref
 from tespy.networks import Network
+from tespy.tools.fluid_properties import CoolPropWrapper
+from tespy.tools.fluid_properties import T_mix_ph
+from tespy.tools.fluid_properties import v_mix_ph
+from tespy.tools.fluid_properties import viscosity_mix_ph
 from tespy.tools.helpers import convert_from_SI
 
 
+def setup_mixture_connection():
+    """Create a standalone connection with an air like mixture."""
+    c = Connection(Source('source'), 'out1', Sink('sink'), 'in1')
+    c.set_attr(fluid={'O2': 0.23, 'N2': 0.77}, mixing_rule='ideal-cond')
+    c._create_fluid_wrapper()
+    c.build_fluid_data()
+    c.p.val_SI = 1e5
+    c.h.val_SI = 4e5
+    c.T.val_SI = 300
+    return c
+
+
+def check_property_cache(c, prop, calc, func):
+    """Check cache hits and invalidation of a connection property."""
+    def expected():
+        return func(
+            c.p.val_SI, c.h.val_SI, c.fluid_data, c.mixing_rule,
+            T0=c.T.val_SI
+        )
+
+    assert math.isclose(calc(), expected(), rel_tol=1e-6)
+
+    # a cached value is returned as long as pressure and enthalpy do not change
+    c._property_cache[prop] = (c.p.val_SI, c.h.val_SI, -1)
+    msg = f'The cached value of {prop} must be returned for unchanged p and h.'
+    assert calc() == -1, msg
+
+    for var in ['p', 'h']:
+        c._property_cache[prop] = (c.p.val_SI, c.h.val_SI, -1)
+        c.get_attr(var).val_SI *= 1.05
+        value = calc()
+        msg = (
+            f'The value of {prop} must be recalculated after a change of '
+            f'{var}, expected {expected()}, is {value}.'
+        )
+        assert math.isclose(value, expected(), rel_tol=1e-6), msg
+
+    # a change of the fluid composition is applied with build_fluid_data
+    c._property_cache[prop] = (c.p.val_SI, c.h.val_SI, -1)
+    c.fluid.val.update({'O2': 0.5, 'N2': 0.5})
+    c.build_fluid_data()
+    value = calc()
+    msg = (
+        f'The value of {prop} must be recalculated after rebuilding the fluid '
+        f'data, expected {expected()}, is {value}.'
+    )
+    assert math.isclose(value, expected(), rel_tol=1e-6), msg
+
+
+def test_temperature_cache():
+    """Test the cached temperature calculation of a connection."""
+    c = setup_mixture_connection()
+    check_property_cache(c, 'T', c.calc_T, T_mix_ph)
+
+
+def test_specific_volume_cache():
+    """Test the cached specific volume calculation of a connection."""
+    c = setup_mixture_connection()
+    check_property_cache(c, 'v', c.calc_vol, v_mix_ph)
+
+
+def test_viscosity_cache():
+    """Test the cached viscosity calculation of a connection."""
+    c = setup_mixture_connection()
+    check_property_cache(c, 'viscosity', c.calc_viscosity, viscosity_mix_ph)
+
+
 class TestConnections:
 
     def setup_method(self):
@@ -123,3 +196,29 @@ class TestConnections:
             f'{m_expected} kg/s, but is {m_is} kg/s'
         )
         assert m_is == m_expected, msg
+
+    def test_shared_fluid_wrapper(self):
+        """Test sharing of fluid property wrappers within a network."""
+        c1, c2 = self.nw.get_conn(
+            ['Some example label', 'source 2:out1_sink 2:in1']
+        )
+        msg = (
+            'Connections of the same network with identical fluid, engine and '
+            'back end must share the fluid property wrapper.'
+        )
+        assert c1.fluid.wrapper['Air'] is c2.fluid.wrapper['Air'], msg
+
+        nw = Network(p_unit='bar', T_unit='C')
+        c3 = Connection(Source('source 3'), 'out1', Sink('sink 3'), 'in1')
+        c4 = Connection(Source('source 4'), 'out1', Sink('sink 4'), 'in1')
+        nw.add_conns(c3, c4)
+        c3.set_attr(m=1, p=1, T=25, fluid={'Air': 1})
+        c4.set_attr(m=1, p=1, T=25, fluid={'Air': 1})
+        wrapper = CoolPropWrapper('Air')
+        c4.fluid.wrapper['Air'] = wrapper
+        nw.solve('design')
+
+        msg = 'Different networks must not share fluid property wrappers.'
+        assert c3.fluid.wrapper['Air'] is not c1.fluid.wrapper['Air'], msg
+        msg = 'A fluid property wrapper provided by the user must be kept.'
+        assert c4.fluid.wrapper['Air'] is wrapper, msg